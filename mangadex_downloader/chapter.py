@@ -81,10 +81,11 @@ class ChapterImages:
             if not (page >= self.start_page):
 
                 if log_info:
-                    pbm.logger.info("Ignoring page %s as \"start_page\" is %s" % (
+                    pbm.logger.info(
+                        "Ignoring page %s as \"start_page\" is %s",
                         page,
                         self.start_page
-                    ))
+                    )
 
                 return False
 
@@ -92,10 +93,11 @@ class ChapterImages:
             if not (page <= self.end_page):
 
                 if log_info:
-                    pbm.logger.info("Ignoring page %s as \"end_page\" is %s" % (
+                    pbm.logger.info(
+                        "Ignoring page %s as \"end_page\" is %s",
                         page,
                         self.end_page
-                    ))
+                    )
 
                 return False
 
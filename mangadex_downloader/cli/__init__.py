@@ -1,8 +1,6 @@
+import logging
 import sys
 import traceback
-from .update import check_update
-from .args_parser import get_args
-from .url import build_url
 from .utils import (
     close_network_object,
     setup_logging,
@@ -10,9 +8,9 @@ from .utils import (
     register_keyboardinterrupt_handler,
     sys_argv
 )
-from .config import build_config
-from .auth import login_with_err_handler, logout_with_err_handler
-from .download import download
+
+# The rest of cli modules are imported in _main()
+# so `--help` and `--version` don't have to load all of them
 
 from ..errors import MangaDexException
 from ..format import deprecated_formats
@@ -46,16 +44,25 @@ def check_deprecated_formats(log, args):
 
 def _main(argv):
     parser = None
+    # Errors can happen before logging is set up (from the lazy imports below),
+    # make sure `log` is always available in the exception handlers
+    log = logging.getLogger('mangadex_downloader')
     try:
         # Signal handler
         register_keyboardinterrupt_handler()
 
         # Get command-line arguments
+        from .args_parser import get_args
         parser, args = get_args(argv)
 
         # Setup logging
         log = setup_logging('mangadex_downloader', args.verbose)
 
+        from .url import build_url
+        from .config import build_config
+        from .auth import login_with_err_handler, logout_with_err_handler
+        from .download import download
+
         # Check deprecated
         check_deprecated_options(log, args)
         check_deprecated_formats(log, args)
@@ -79,6 +86,7 @@ def _main(argv):
         logout_with_err_handler(args)
 
         # Check update
+        from .update import check_update
         check_update()
 
         # Cleaning up
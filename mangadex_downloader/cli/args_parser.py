@@ -280,6 +280,16 @@ def get_args(argv):
         help='Stop download chapter page from given page number',
         metavar='NUM_PAGE'
     )
+    chap_page_group.add_argument(
+        '--page-workers',
+        '-pw',
+        help='Set how many chapter pages are downloaded at the same time. ' \
+             'Setting this too high can get you rate limited by MangaDex network, ' \
+             'by default it set to 4. ' \
+             'If --delay-requests is set, chapter pages are downloaded one by one',
+        metavar='NUMBERS',
+        default=config.page_workers
+    )
 
     # Images related
     img_group = parser.add_argument_group('Images')
@@ -365,7 +375,8 @@ def get_args(argv):
     network_group.add_argument(
         '--delay-requests',
         '-dr',
-        help='Set delay for each requests send to MangaDex server',
+        help='Set delay for each requests send to MangaDex server. ' \
+             'This will make chapter pages downloaded one by one (--page-workers is ignored)',
         type=float,
         metavar='TIME_IN_SECONDS'
     )
@@ -99,6 +99,10 @@ class _Config:
             5,
             validate_http_retries
         ],
+        "page_workers": [
+            4,
+            validate_page_workers
+        ],
         "write_tachiyomi_info": [
             False,
             validate_bool
@@ -38,7 +38,8 @@ __all__ = (
     "validate_bool", "validate_language", "validate_value_from_iterator",
     "validate_format", "dummy_validator", "validate_zip_compression_type",
     "validate_int", "validate_tag", "validate_blacklist",
-    "validate_sort_by", "validate_http_retries", "validate_download_mode",
+    "validate_sort_by", "validate_http_retries", "validate_page_workers",
+    "validate_download_mode",
     "validate_doh_provider", "validate_log_level", "validate_progress_bar_layout",
     "validate_stacked_progress_bar_order",
     "load_env", "LazyLoadEnv", "ConfigTypeError"
@@ -172,6 +173,19 @@ def validate_http_retries(val):
     
     return val
 
+def validate_page_workers(val):
+    try:
+        workers = int(val)
+    except ValueError:
+        raise ConfigTypeError(f"'{val}' is not valid 'page_workers' value, it must be numbers") from None
+
+    if workers < 1:
+        raise ConfigTypeError(
+            f"'{val}' is not valid 'page_workers' value, it must be greater than 0"
+        )
+
+    return workers
+
 def validate_download_mode(val):
     val = val.lower().strip()
 
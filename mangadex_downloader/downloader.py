@@ -36,11 +36,14 @@ log = logging.getLogger(__name__)
 _cleanup_jobs = []
 
 class FileDownloader:
-    def __init__(self, url, file, replace=False, use_requests=False, **headers) -> None:
+    def __init__(self, url, file, replace=False, use_requests=False, progress_bar=True, **headers) -> None:
         self.url = url
         self.file = str(file) + '.temp'
         self.real_file = file
         self.replace = replace
+        # The file sizes progress bar is shared (see `progress_bar_manager`),
+        # disable it if there is another downloaders running concurrently
+        self.progress_bar = progress_bar
         self.headers_request = headers
         self.chunk_size = 2 ** 13
 
@@ -66,6 +69,9 @@ class FileDownloader:
         _cleanup_jobs.append(lambda: self.cleanup())
 
     def _build_progres_bar(self, initial_size, file_sizes, desc='file_sizes'):
+        if not self.progress_bar:
+            return
+
         pbm.set_file_sizes_initial(initial_size or 0)
         pbm.set_file_sizes_total(file_sizes)
         self._tqdm = pbm.get_file_sizes_pb(recreate=not pbm.stacked)
@@ -182,7 +188,10 @@ class FileDownloader:
             real_file_sizes = self._get_file_size(self.real_file)
             if real_file_sizes:
                 if file_sizes == real_file_sizes and not self.replace:
-                    pbm.logger.info('File exist and replace is False, cancelling download...')
+                    pbm.logger.info(
+                        "File '%s' exist and replace is False, cancelling download...",
+                        os.path.basename(self.real_file)
+                    )
                     self.on_finish()
                     return True
 
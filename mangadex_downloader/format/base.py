@@ -23,20 +23,99 @@
 import logging
 import os
 import shutil
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .utils import (
     NumberWithLeadingZeros,
     verify_sha256,
     write_tachiyomi_details,
     get_md_file_hash,
     create_file_hash_sha256,
-    QueueWorkerReadMarker
+    QueueWorkerReadMarker,
+    ChapterImagesPrefetcher
 )
 from ..downloader import ChapterPageDownloader
-from ..utils import QueueWorker, create_directory, delete_file
+from ..network import Net
+from ..errors import MangaDexException
+from ..utils import create_directory, delete_file
 from ..progress_bar import progress_bar_manager as pbm
 
 log = logging.getLogger(__name__)
 
+class _FormatWorker:
+    """Run PDF, ZIP, etc processing jobs that cannot be interrupted by CTRL+C
+
+    See BaseFormat.create_worker() for more info
+    """
+    _signals = [signal.SIGINT, signal.SIGTERM]
+
+    def __init__(self):
+        self._handlers = {}
+        self._running = 0
+        self._pending_signal = None
+
+    def _handle_signal(self, signum, frame):
+        if self._running:
+            # Deliver it after the job is done
+            self._pending_signal = signum
+        else:
+            self._deliver_signal(signum, frame)
+
+    def _deliver_signal(self, signum, frame):
+        handler = self._handlers.get(signum)
+        if callable(handler):
+            handler(signum, frame)
+        elif handler == signal.SIG_DFL:
+            signal.signal(signum, signal.SIG_DFL)
+            signal.raise_signal(signum)
+
+    def start(self):
+        """Install the signal handlers, see BaseFormat.create_worker()"""
+        # Signal handlers can only be set in main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        # The previous format run may not call stop() (an error occured),
+        # do not overwrite the original handlers with ours
+        if self._handlers:
+            return
+
+        self._handlers = {sig: signal.signal(sig, self._handle_signal) for sig in self._signals}
+
+    def stop(self):
+        """Restore the original signal handlers"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        for sig, handler in self._handlers.items():
+            signal.signal(sig, handler)
+        self._handlers.clear()
+
+    def submit(self, job):
+        """Run the job in current thread and return the result"""
+        # Signals are only received in main thread
+        if threading.current_thread() is not threading.main_thread():
+            return job()
+
+        # This is a counter (not a flag), so nested submit() calls
+        # will not deliver the signal while outer job is still running
+        self._running += 1
+        try:
+            return job()
+        finally:
+            self._running -= 1
+
+            signum = self._pending_signal
+            if not self._running and signum is not None:
+                self._pending_signal = None
+
+                # CTRL+C is pressed while the job is running
+                # Now the job is done, deliver it to the original handler
+                self._deliver_signal(signum, None)
+
+_format_worker = _FormatWorker()
+
 class BaseFormat:
     def __init__(
         self,
@@ -67,6 +146,16 @@ class BaseFormat:
 
         self.worker = None
 
+        # --delay-requests is applied in each thread that sending requests,
+        # download the pages one by one so the delay is still respected
+        if Net.mangadex.delay:
+            self.page_workers = 1
+        else:
+            self.page_workers = config.page_workers
+
+        # Fetch images from the next chapters while downloading
+        self.images_prefetcher = ChapterImagesPrefetcher()
+
         if config.progress_bar_layout == "stacked":
             pbm.stacked = True
         
@@ -74,32 +163,58 @@ class BaseFormat:
         # Shutdown some worker threads
         self.chapter_read_marker.shutdown(blocking=True)
 
-        if self.worker:
-            self.worker.shutdown(blocking=True)
+        if self.worker is not None:
+            self.worker.stop()
 
         if pbm.stacked:
             pbm.close_all()
             pbm.stacked = False
 
+    def _download_page(self, chap_name, page, img_url, img_path, replace):
+        pbm.logger.info('Downloading %s page %s', chap_name, page)
+
+        # Pages are downloaded concurrently if --page-workers is more than 1,
+        # the file sizes progress bar cannot be shared between them
+        downloader = ChapterPageDownloader(
+            img_url,
+            img_path,
+            replace=replace,
+            progress_bar=self.page_workers <= 1
+        )
+        success = downloader.download()
+        downloader.cleanup()
+
+        return success
+
     def get_images(self, chap_class, images, path, count):
         imgs = []
         chap = chap_class.chapter
         chap_name = chap_class.get_name()
+        img_kind = 'compressed images' if self.compress_img else 'images'
 
         # Fetching chapter images
-        pbm.logger.info('Getting %s from chapter %s' % (
-            'compressed images' if self.compress_img else 'images',
-            chap
-        ))
-        images.fetch()
+        pbm.logger.info('Getting %s from chapter %s', img_kind, chap)
+
+        # The images might be already fetched in another thread
+        if not self.images_prefetcher.pop(images):
+            images.fetch()
 
         total = sum(1 for _ in images.iter())
 
         pbm.set_pages_total(total)
         pages_pb = pbm.get_pages_pb()
 
-        while True:
+        # Pages that has been downloaded successfully
+        # We don't want to re-download (or re-verify) them if one of MangaDex network is failing
+        downloaded = set()
+
+        max_attempts = 5
+        for attempt, _ in enumerate(range(max_attempts), start=1):
             error = False
+            jobs = []
+
+            # Used to rollback numbering pages if one of MangaDex network is failing
+            counted = 0
             for page, img_url, img_name in images.iter(log_info=True):
                 
                 img_hash = get_md_file_hash(img_name)
@@ -108,6 +223,16 @@ class BaseFormat:
 
                 img_path = path / img_name
 
+                # Page number is reserved for this image
+                # regardless the image is downloaded or not
+                imgs.append(img_path)
+                count.increase()
+                counted += 1
+
+                if img_path in downloaded:
+                    pages_pb.update(1)
+                    continue
+
                 # This can be `True`, `False`, or `None`
                 # `True`: Verify success, hash matching
                 # `False`: Verify failed, hash is not matching
@@ -123,8 +248,6 @@ class BaseFormat:
                 # Continue to download the others
                 if verified and not self.replace:
                     pbm.logger.debug(f"Page {page} ({img_name}) exists and is verified, cancelling download...")
-                    count.increase()
-                    imgs.append(img_path)
                     pages_pb.update(1)
                     continue
                 elif verified == False and not self.replace:
@@ -133,41 +256,66 @@ class BaseFormat:
                         f"Page {page} ({img_name}) exists but failed to verify (hash is not matching), " \
                         "re-downloading..."
                     )
-                
-                pbm.logger.info('Downloading %s page %s' % (
-                    chap_name,
-                    page
-                ))
-
-                downloader = ChapterPageDownloader(
-                    img_url,
-                    img_path,
-                    replace=replace,
-                )
-                success = downloader.download()
-                downloader.cleanup()
-
-                # One of MangaDex network are having problem
-                # Fetch the new one, and start re-downloading
-                if not success:
-                    pbm.logger.error('One of MangaDex network is failing, re-fetching the images...')
-                    pbm.logger.info('Getting %s from chapter %s' % (
-                        'compressed images' if self.compress_img else 'images',
-                        chap
-                    ))
-                    error = True
-                    images.fetch()
-                    pages_pb.reset()
-                    break
-                else:
-                    imgs.append(img_path)
-                    count.increase()
+
+                jobs.append((page, img_url, img_path, replace))
+
+            # Download the pages concurrently,
+            # the order of the pages is already determined by `count`
+            executor = ThreadPoolExecutor(max_workers=self.page_workers)
+            futures = {}
+            try:
+                for page, img_url, img_path, replace in jobs:
+                    fut = executor.submit(
+                        self._download_page, chap_name, page, img_url, img_path, replace
+                    )
+                    futures[fut] = img_path
+
+                for fut in as_completed(futures):
+                    success = fut.result()
+
+                    # One of MangaDex network are having problem
+                    # Fetch the new one, and start re-downloading
+                    if not success:
+                        error = True
+                        break
+
                     pages_pb.update(1)
-                    continue
-            
+            finally:
+                # Do not download the rest of pages if one of them is failing
+                for fut in futures:
+                    fut.cancel()
+                executor.shutdown(wait=True)
+
             if not error:
                 return imgs
 
+            for fut, img_path in futures.items():
+                if fut.cancelled() or fut.exception() is not None:
+                    continue
+
+                if fut.result():
+                    downloaded.add(img_path)
+
+            # Re-use the same page numbers for re-downloading
+            imgs.clear()
+            count.decrease(counted)
+
+            if attempt >= max_attempts:
+                break
+
+            pbm.logger.error(
+                'One of MangaDex network is failing, re-fetching the images... (attempt: %s)',
+                attempt
+            )
+            pbm.logger.info('Getting %s from chapter %s', img_kind, chap)
+            images.fetch()
+            pages_pb.reset()
+
+        raise MangaDexException(
+            f"Failed to download images from chapter {chap}, " \
+            f"MangaDex network is still failing after {max_attempts} attempts"
+        )
+
     def mark_read_chapter(self, *chapters):
         """Mark a chapter as read"""
         if (
@@ -329,7 +477,7 @@ class BaseFormat:
         # corrupted files.
         # The purpose of this function is to prevent interrupt from CTRL+C
         # Let the job done safely and then shutdown gracefully
-        self.worker = QueueWorker()
+        self.worker = _format_worker
         self.worker.start()
 
     def main(self):
@@ -428,23 +576,35 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
             chapters_pb = pbm.get_chapters_pb()
             volumes_pb = pbm.get_volumes_pb()
 
-            for index, (chap_class, images) in enumerate(chapters, start=1):
+            def is_completed(item):
+                chap_class, _ = item
+                chap_name = chap_class.get_simplified_name()
+                file_path = self.path / (chap_name + self.file_ext)
+
+                return (
+                    file_path.exists() and
+                    not self.replace and
+                    self.check_fi_completed(chap_name)
+                )
+
+            iter_chapters = self.images_prefetcher.iter(chapters, skip=is_completed)
+            for index, (chap_class, images) in enumerate(iter_chapters, start=1):
                 chap_name = chap_class.get_simplified_name()
 
                 file_path = self.path / (chap_name + self.file_ext)
 
                 # Check if file is exist or not
-                if file_path.exists():
-                    if self.replace:
-                        delete_file(file_path)
-                    elif self.check_fi_completed(chap_name):
-                        pbm.logger.info(f"{file_path.name!r} already exists, cancelling download...")
+                # (same rule as the prefetcher, see is_completed())
+                if is_completed((chap_class, images)):
+                    pbm.logger.info(f"{file_path.name!r} already exists, cancelling download...")
 
-                        # Store file_info tracker for existing chapter
-                        self.add_fi(chap_name, chap_class.id, file_path)
+                    # Store file_info tracker for existing chapter
+                    self.add_fi(chap_name, chap_class.id, file_path)
 
-                        chapters_pb.update(1)
-                        continue
+                    chapters_pb.update(1)
+                    continue
+                elif self.replace:
+                    delete_file(file_path)
 
                 chapter_path = create_directory(chap_name, self.path)
 
@@ -611,7 +771,7 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
 
             self.on_prepare(file_path, volume, count)
 
-            for chap_class, chap_images in chapters:
+            for chap_class, chap_images in self.images_prefetcher.iter(chapters):
                 self.on_iter_chapter(file_path, chap_class, count)
 
                 ims = self.get_images(chap_class, chap_images, volume_path, count)
@@ -774,7 +934,7 @@ class ConvertedSingleFormat(BaseConvertedFormat):
             chapters_pb = pbm.get_chapters_pb()
             volumes_pb = pbm.get_volumes_pb()
 
-            for chap_class, chap_images in chapters:
+            for chap_class, chap_images in self.images_prefetcher.iter(chapters):
                 self.on_iter_chapter(file_path, chap_class, count)
 
                 ims = self.get_images(chap_class, chap_images, path, count)
@@ -61,7 +61,18 @@ class Raw(BaseFormat):
             chapters_pb = pbm.get_chapters_pb()
             volumes_pb = pbm.get_volumes_pb()
 
-            for index, (chap_class, images) in enumerate(chapters, start=1):
+            # NOTE: This doesn't verify the images like the loop below does,
+            # (hashing them again in prefetcher thread is too expensive).
+            # A completed chapter with unverified images is not prefetched
+            # and get_images() will fetch the images by itself
+            def is_completed(item):
+                chap_class, _ = item
+                file_info = manga.tracker.get(chap_class.get_simplified_name())
+
+                return file_info is not None and file_info.completed
+
+            iter_chapters = self.images_prefetcher.iter(chapters, skip=is_completed)
+            for index, (chap_class, images) in enumerate(iter_chapters, start=1):
                 failed_images = []
                 chap_name = chap_class.get_simplified_name()
 
@@ -211,8 +222,12 @@ class RawVolume(BaseFormat):
             # (hash is not matching)
             chapter_failed_images = set(i.chapter_id for i in failed_images)
 
-            for chap_class, images in chapters:
-                if chap_class.id not in chapter_failed_images and fi_completed:
+            def is_verified(item):
+                chap_class, _ = item
+                return chap_class.id not in chapter_failed_images and fi_completed
+
+            for chap_class, images in self.images_prefetcher.iter(chapters, skip=is_verified):
+                if is_verified((chap_class, images)):
                     count.increase(chap_class.pages)
                     continue
 
@@ -338,8 +353,12 @@ class RawSingle(BaseFormat):
             chapters_pb = pbm.get_chapters_pb()
             volumes_pb = pbm.get_volumes_pb()
 
-            for chap_class, images in cache:
-                if chap_class.id not in chapter_failed_images and fi_completed:
+            def is_verified(item):
+                chap_class, _ = item
+                return chap_class.id not in chapter_failed_images and fi_completed
+
+            for chap_class, images in self.images_prefetcher.iter(cache, skip=is_verified):
+                if is_verified((chap_class, images)):
                     count.increase(chap_class.pages)
                     chapters_pb.update(1)
                     continue
@@ -20,9 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import atexit
 import hashlib
 import logging
 import os
+import queue
 import re
 import threading
 import time
@@ -252,6 +254,101 @@ def write_tachiyomi_details(manga, path):
     with open(path, 'wb') as writer:
         writer.write(json_op.dumps(data, convert_str=False))
 
+class ChapterImagesPrefetcher:
+    """Fetch chapter images in another thread ahead of time
+
+    While a chapter is being downloaded, images from the next chapters
+    are fetched in the background. Use :meth:`iter` to iterate ``(chapter, images)``
+    and :meth:`pop` in :meth:`BaseFormat.get_images` to check
+    if the images has been fetched by this class.
+    """
+    def __init__(self, max_size=2) -> None:
+        self.max_size = max_size
+
+        self._fetched = set()
+        self._lock = threading.Lock()
+
+    def _put(self, q, stop, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+            except queue.Full:
+                continue
+            else:
+                return
+
+    def _fetch_images(self, q, stop, items):
+        for chap_class, images in items:
+            if stop.is_set():
+                return
+
+            try:
+                images.fetch()
+            except Exception as e:
+                # Let the main thread fetch the images
+                # so the error can be handled properly
+                log.debug('Failed to prefetch images from chapter %s, reason: %s', chap_class.chapter, e)
+            else:
+                with self._lock:
+                    if stop.is_set():
+                        return
+
+                    self._fetched.add(images)
+
+            self._put(q, stop, images)
+
+    def pop(self, images):
+        """Return ``True`` if images has been fetched by this class"""
+        with self._lock:
+            try:
+                self._fetched.remove(images)
+            except KeyError:
+                return False
+            else:
+                return True
+
+    def iter(self, chapters, skip=None):
+        """Iterate ``(chapter, images)`` while fetching the next images in another thread
+
+        ``skip`` is an optional function that takes ``(chapter, images)``
+        and return ``True`` if the chapter is not going to be downloaded,
+        so the images will not be fetched.
+        """
+        chapters = list(chapters)
+        fetch_indexes = set()
+        items = []
+        for index, item in enumerate(chapters):
+            if skip is not None and skip(item):
+                continue
+
+            fetch_indexes.add(index)
+            items.append(item)
+
+        q = queue.Queue(maxsize=self.max_size)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._fetch_images,
+            args=(q, stop, items),
+            name=f'{self.__class__.__name__}-fetch-images',
+            daemon=True
+        )
+        thread.start()
+
+        try:
+            for index, item in enumerate(chapters):
+                if index in fetch_indexes:
+                    # Wait until the images is fetched
+                    q.get()
+
+                yield item
+        finally:
+            # Stop fetching images if the download is finished or interrupted
+            with self._lock:
+                stop.set()
+
+                for _, images in items:
+                    self._fetched.discard(images)
+
 class QueueWorkerReadMarker(threading.Thread):
     """A queue-based worker run in another thread for ChapterReadMarker
     
@@ -259,7 +356,8 @@ class QueueWorkerReadMarker(threading.Thread):
     and will be done asynchronously (in another thread)
     """
     def __init__(self, manga_id) -> None:
-        threading.Thread.__init__(self)
+        # Daemon thread, so it will not block the app from exiting
+        threading.Thread.__init__(self, daemon=True)
 
         # "Circular Imports" problem
         from ..network import Net, base_url
@@ -273,32 +371,11 @@ class QueueWorkerReadMarker(threading.Thread):
 
         self.manga_id = manga_id
 
-        cls_name = self.__class__.__name__
-        # Thread to check if mainthread is alive or not
-        # if not, then thread queue must be shutted down too
-        self._thread_wait_mainthread = threading.Thread(
-            target=self._wait_mainthread, 
-            name=f'{cls_name}-wait-mainthread, {cls_name}_id={self.ident}'
-        )
-
     def start(self):
         super().start()
-        self._thread_wait_mainthread.start()
-
-    def _wait_mainthread(self):
-        """Wait for mainthread to exit and then shutdown :class:`QueueWorker` thread"""
-        main_thread = threading.main_thread()
 
-        while True:
-            main_thread.join(timeout=1)
-            if not self.is_alive():
-                # QueueWorker already shutted down
-                # Possibly because of QueueWorker.shutdown() is called
-                return
-            elif not main_thread.is_alive():
-                # Main thread already shutted down
-                # and QueueWorker still alive, terminate it
-                self._shutdown.set()
+        # Send the remaining chapters before the app is exiting
+        atexit.register(self.shutdown, blocking=True)
 
     def submit(self, chapter_id):
         """Submit a chapter id that will marked as read"""
@@ -313,6 +390,9 @@ class QueueWorkerReadMarker(threading.Thread):
         if blocking:
             self.join()
 
+            # The thread is finished, there is nothing to do at exit
+            atexit.unregister(self.shutdown)
+
     def run(self):
         while True:
             if self._shutdown.is_set() and not self._chapters:
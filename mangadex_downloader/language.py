@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 from enum import Enum
+from functools import lru_cache
 
 # Adapted from https://github.com/tachiyomiorg/tachiyomi-extensions/blob/master/src/all/mangadex/src/eu/kanade/tachiyomi/extension/all/mangadex/MangaDexFactory.kt
 class Language(Enum):
@@ -88,6 +89,7 @@ class RomanizedLanguage(Enum):
     RomanizedKorean = 'ko-ro'
     RomanizedChinese = 'zh-ro'
 
+@lru_cache(maxsize=64)
 def get_language(lang):
     try:
         return Language[lang]
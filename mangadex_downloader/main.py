@@ -24,7 +24,8 @@ import logging
 import re
 import os
 from pathlib import Path
-from .errors import UnhandledException
+from concurrent.futures import ThreadPoolExecutor
+from .errors import UnhandledException, MangaDexException
 from .utils import (
     comma_separated_text,
     create_directory,
@@ -44,6 +45,23 @@ from .tracker import get_tracker
 
 log = logging.getLogger(__name__)
 
+def _check_range(start, end, name):
+    # Validate it before sending any requests to MangaDex
+    if start is not None and end is not None and start > end:
+        raise MangaDexException(f"start_{name} cannot be more than end_{name}")
+
+def _download_cover(url, path, replace):
+    fd = FileDownloader(
+        url,
+        path,
+        replace=replace,
+        # It's downloaded while chapter pages are downloading,
+        # see FileDownloader.__init__()
+        progress_bar=False,
+    )
+    fd.download()
+    fd.cleanup()
+
 def download(
     manga_id,
     replace=False,
@@ -57,6 +75,9 @@ def download(
     _range=None,
 ):
     """Download a manga"""
+    _check_range(start_chapter, end_chapter, "chapter")
+    _check_range(start_page, end_page, "page")
+
     save_as = config.save_as
     cover = config.cover
 
@@ -96,19 +117,17 @@ def download(
     cover_url = get_cover_art_url(manga.id, manga.cover, cover)
     
     # Download the cover art
+    cover_fut = None
     if cover == 'none':
         log.info('Not downloading cover manga, since "cover" is none')
     elif cover_url is None:
         # The manga doesn't have cover
         log.info(f"Not downloading cover manga, since manga '{manga.title}' doesn\'t have cover")
     else:
-        fd = FileDownloader(
-            cover_url,
-            cover_path,
-            replace=replace,
-        )
-        fd.download()
-        fd.cleanup()
+        # Download it in another thread, so it doesn't block the chapters download
+        cover_worker = ThreadPoolExecutor(max_workers=1)
+        cover_fut = cover_worker.submit(_download_cover, cover_url, cover_path, replace)
+        cover_worker.shutdown(wait=False)
 
     # Reuse is good
     def download_manga(m, path):
@@ -136,36 +155,50 @@ def download(
         # Execute main format
         fmt.main()
 
-    if all_languages:
-        # Print info to users
-        # Let the users know how many translated languages available
-        # in given manga
-        translated_langs = [i.name for i in manga.translated_languages]
-        log.info(f"Available translated languages = {comma_separated_text(translated_langs)}")
+    try:
+        if all_languages:
+            # Print info to users
+            # Let the users know how many translated languages available
+            # in given manga
+            translated_langs = [i.name for i in manga.translated_languages]
+            log.info(f"Available translated languages = {comma_separated_text(translated_langs)}")
 
-        for translated_lang in manga.translated_languages:
-            log.info(f"Downloading {manga.title} in {translated_lang.name} language")
+            for translated_lang in manga.translated_languages:
+                log.info(f"Downloading {manga.title} in {translated_lang.name} language")
 
-            # Copy title and description manga
-            new_manga = Manga(data=manga._data)
-            new_manga._title = manga.title
-            new_manga._description = manga.description
+                # Copy title and description manga
+                new_manga = Manga(data=manga._data)
+                new_manga._title = manga.title
+                new_manga._description = manga.description
 
-            # Fetch all chapters
-            new_manga.fetch_chapters(translated_lang.value, all_chapters=True)
+                # Fetch all chapters
+                new_manga.fetch_chapters(translated_lang.value, all_chapters=True)
 
-            new_path = base_path / translated_lang.name
-            new_path.mkdir(exist_ok=True)
+                new_path = base_path / translated_lang.name
+                new_path.mkdir(exist_ok=True)
 
-            log.info(f'Download directory is set to "{new_path.resolve()}"')
-            download_manga(new_manga, new_path)
+                log.info(f'Download directory is set to "{new_path.resolve()}"')
+                download_manga(new_manga, new_path)
 
-            log.info(f"Download finished for manga {manga.title} in {translated_lang.name} language")
+                log.info(f"Download finished for manga {manga.title} in {translated_lang.name} language")
         
-    else:
-        log.info(f'Download directory is set to "{base_path.resolve()}"')
-        download_manga(manga, base_path)
-                
+        else:
+            log.info(f'Download directory is set to "{base_path.resolve()}"')
+            download_manga(manga, base_path)
+    except BaseException as e:
+        # Don't let the cover art error disappear if the download is aborted
+        # (but don't wait for it if CTRL+C is pressed, the CLI handler
+        # will raise SystemExit instead of KeyboardInterrupt)
+        if cover_fut is not None and (cover_fut.done() or isinstance(e, Exception)):
+            cover_err = cover_fut.exception()
+            if cover_err is not None:
+                log.error("Failed to download cover manga, reason: %s", cover_err)
+        raise
+
+    # Make sure the cover art is finished downloading
+    if cover_fut is not None:
+        cover_fut.result()
+
     log.info("Download finished for manga \"%s\"" % manga.title)
     return manga
 
@@ -176,6 +209,8 @@ def download_chapter(
     end_page=None,
 ):
     """Download a chapter"""
+    _check_range(start_page, end_page, "page")
+
     save_as = config.save_as
     fmt_class = get_format(save_as)
 
@@ -23,6 +23,7 @@
 # Based on https://github.com/mansuf/zippyshare-downloader/blob/main/zippyshare_downloader/network.py
 
 import requests
+import requests.adapters
 import itertools
 import urllib.parse
 import time
@@ -103,6 +104,14 @@ class requestsMangaDexSession(ModifiedSession):
         from .config import login_cache, config_enabled, config
 
         super().__init__()
+
+        # Chapter pages are downloaded concurrently (see `page_workers` config),
+        # make sure every page worker can reuse keep-alive connection
+        pool_size = max(requests.adapters.DEFAULT_POOLSIZE, config.page_workers)
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
         self.trust_env = trust_env
         self.user = None
         self.delay = None
@@ -384,19 +393,25 @@ class requestsMangaDexSession(ModifiedSession):
         log.info("Logged out from MangaDex")
 
     def _report(self, data):
-        pbm.logger.debug('Reporting %s to MangaDex network' % data)
+        pbm.logger.debug('Reporting %s to MangaDex network', data)
         r = self.post('https://api.mangadex.network/report', json=data)
 
         if r.status_code != 200:
-            pbm.logger.debug('Failed to report %s to MangaDex network' % data)
+            pbm.logger.debug('Failed to report %s to MangaDex network', data)
         else:
-            pbm.logger.debug('Successfully send report %s to MangaDex network' % data)
+            pbm.logger.debug('Successfully send report %s to MangaDex network', data)
 
     def report(self, data):
         """Report to MangaDex network"""
         job = lambda: self._report(data)
         self._worker_report.submit(job, blocking=False)
 
+    def close(self):
+        # Send the remaining reports before the session is closed
+        self._worker_report.shutdown(blocking=True)
+
+        super().close()
+
 class NetworkManager:
     """A requests and MangaDex session manager"""
 
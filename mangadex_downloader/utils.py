@@ -23,10 +23,11 @@
 import os
 import re
 import time
+import atexit
 import logging
 import sys
 import threading
-import queue
+import collections
 import itertools
 from pathlib import Path
 from pathvalidate import sanitize_filename
@@ -120,13 +121,13 @@ def comma_separated_text(array):
 
 def delete_file(file):
     """Helper function to delete file, retry 5 times if error happens"""
-    if not os.path.exists(file):
-        return
-
     err = None
     for attempt in range(5):
         try:
             os.remove(file)
+        except FileNotFoundError:
+            # The file is not exist, there is nothing to delete
+            return
         except Exception as e:
             log.debug("Failed to delete file \"%s\", reason: %s. Trying... (attempt: %s)" % (
                 file,
@@ -147,35 +148,25 @@ def delete_file(file):
 class QueueWorker(threading.Thread):
     """A queue-based worker run in another thread"""
     def __init__(self) -> None:
-        threading.Thread.__init__(self)
+        # Daemon thread, so it will not block the app from exiting
+        threading.Thread.__init__(self, daemon=True)
 
-        self._queue = queue.Queue()
-
-        # Thread to check if mainthread is alive or not
-        # if not, then thread queue must be shutted down too
-        self._thread_wait_mainthread = threading.Thread(
-            target=self._wait_mainthread, 
-            name=f'QueueWorker-wait-mainthread, QueueWorker_id={self.ident}'
-        )
+        # Multiple producers (every page worker sends reports) and a single consumer,
+        # deque + Condition is enough (and cheaper than queue.Queue)
+        # as long as every append is done while holding the Condition
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
 
     def start(self):
         super().start()
-        self._thread_wait_mainthread.start()
 
-    def _wait_mainthread(self):
-        """Wait for mainthread to exit and then shutdown :class:`QueueWorker` thread"""
-        main_thread = threading.main_thread()
+        # Finish the pending jobs before the app is exiting
+        atexit.register(self.shutdown, blocking=True)
 
-        while True:
-            main_thread.join(timeout=1)
-            if not self.is_alive():
-                # QueueWorker already shutted down
-                # Possibly because of QueueWorker.shutdown() is called
-                return
-            elif not main_thread.is_alive():
-                # Main thread already shutted down
-                # and QueueWorker still alive, terminate it
-                self._queue.put(None)
+    def _put(self, data):
+        with self._cond:
+            self._queue.append(data)
+            self._cond.notify()
 
     def submit(self, job, blocking=True):
         """Submit a job and return the result
@@ -186,7 +177,7 @@ class QueueWorker(threading.Thread):
         """
         fut = Future()
         data = [fut, job]
-        self._queue.put(data)
+        self._put(data)
 
         if not blocking:
             return fut
@@ -199,14 +190,20 @@ class QueueWorker(threading.Thread):
 
     def shutdown(self, blocking=False):
         """Shutdown the thread by passing ``None`` value to queue"""
-        self._queue.put(None)
+        self._put(None)
 
         if blocking:
             self.join()
 
+            # The thread is finished, there is nothing to do at exit
+            atexit.unregister(self.shutdown)
+
     def run(self):
         while True:
-            data = self._queue.get()
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue)
+                data = self._queue.popleft()
+
             if data is None:
                 # Shutdown signal is received
                 # begin shutting down
@@ -214,12 +211,14 @@ class QueueWorker(threading.Thread):
 
             fut, job = data
             try:
-                job()
-            except Exception as err:
+                result = job()
+            except BaseException as err:
+                # Pass the error to the caller, otherwise the caller will wait forever
+                # if the error is not derived from Exception
                 log.error("We have problem in queue worker", exc_info=err)
                 fut.set_exception(err)
             else:
-                fut.set_result(None)
+                fut.set_result(result)
 
 def convert_int_or_float(value):
     err_int = None